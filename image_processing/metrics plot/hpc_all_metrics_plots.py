@@ -1,12 +1,29 @@
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # non-interactive: plots are only saved, never shown
 import matplotlib.pyplot as plt
 
+# Small line charts: render at screen DPI and let Agg simplify paths
+plt.rcParams.update({
+    "figure.dpi": 72,
+    "savefig.dpi": 72,
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+})
+plt.rcParams["svg.fonttype"] = "none"  # SVG text stays <text>, not glyph paths
+
 # ==========================
 # Make output folder
 # ==========================
 OUTPUT_DIR = "output images"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+# SVG is the default (vector, no Agg rasterization); PNG is opt-in
+PLOT_FORMATS = ("svg", "png")
+GRID_PATHS = {fmt: os.path.join(OUTPUT_DIR, f"all_metrics_grid.{fmt}") for fmt in PLOT_FORMATS}
 
 # ==========================
 # Raw timing data (seconds)
@@ -22,37 +39,20 @@ T_seq_small  = 0.8420
 T_seq_medium = 3.3020
 T_seq_fine   = 12.1860
 
-# Parallel – medium image, varying threads
-par_medium_by_threads = {
-    3: 2.0530,
-    6: 1.9570,
-    8: 1.9360,
-    12: 1.9330,
-    15: 1.9260,
-}
-
-# Hybrid (GPU) – medium image, varying threads
-hyb_medium_by_threads = {
-    3: 1.2751,
-    6: 1.2445,
-    8: 1.3129,
-    12: 1.2633,
-    15: 1.3226,
-}
-
-# Parallel – fine image, "processors" = threads {2,5,9}
-par_fine_by_procs = {
-    2: 8.7610,
-    5: 6.9300,
-    9: 6.8020,
-}
+# Medium image, varying threads
+# (parallel arrays: index i is threads_medium[i])
+threads_medium = np.array([3, 6, 8, 12, 15])
+# Parallel
+par_medium = np.array([2.0530, 1.9570, 1.9360, 1.9330, 1.9260])
+# Hybrid (GPU)
+hyb_medium = np.array([1.2751, 1.2445, 1.3129, 1.2633, 1.3226])
 
-# Hybrid – fine image, processors {2,5,9}
-hyb_fine_by_procs = {
-    2: 4.2071,
-    5: 5.4811,
-    9: 4.4037,
-}
+# Fine image, "processors" = threads {2,5,9}
+procs_fine = np.array([2, 5, 9])
+# Parallel
+par_fine = np.array([8.7610, 6.9300, 6.8020])
+# Hybrid
+hyb_fine = np.array([4.2071, 5.4811, 4.4037])
 
 # Granularity view (8 threads)
 # Parallel
@@ -71,270 +71,197 @@ granularity_data_time = {
     "Fine":   (T_seq_fine,   T_par_fine_8,   T_hyb_fine_8,   PIX_FINE),
 }
 
+# ============================================================
+# Derived metrics, precomputed once as NumPy arrays
+# TABLE[(axis, metric)] = (seq, par, hyb)
+# ============================================================
+def derive_metrics(p, seq_t, par_t, hyb_t, pix):
+    S_seq = seq_t / seq_t
+    S_par = seq_t / par_t
+    S_hyb = seq_t / hyb_t
+    return {
+        "time":       (seq_t, par_t, hyb_t),
+        "speedup":    (S_seq, S_par, S_hyb),
+        "efficiency": (S_seq / p, S_par / p, S_hyb / p),
+        "cost":       (1 * seq_t, p * par_t, p * hyb_t),
+        "throughput": (pix / (seq_t * 1e6), pix / (par_t * 1e6), pix / (hyb_t * 1e6)),
+    }
+
+# Sequential time is constant along the threads / processors views
+seq_medium = np.full(len(threads_medium), T_seq_medium)
+seq_fine = np.full(len(procs_fine), T_seq_fine)
+
+# Granularity view (8 threads)
+gran_values = np.array(list(granularity_data_time.values()))
+seq_gran_arr, par_gran_arr, hyb_gran_arr, pix_gran_arr = gran_values.T
+
+def build_metrics_table():
+    metrics_by_axis = {
+        "threads": derive_metrics(threads_medium, seq_medium,
+                                  par_medium, hyb_medium, PIX_MED),
+        "processors": derive_metrics(procs_fine, seq_fine,
+                                     par_fine, hyb_fine, PIX_FINE),
+        "granularity": derive_metrics(8, seq_gran_arr,
+                                      par_gran_arr, hyb_gran_arr, pix_gran_arr),
+    }
+    return {
+        (axis_name, metric_name): ys
+        for axis_name, metrics in metrics_by_axis.items()
+        for metric_name, ys in metrics.items()
+    }
+
+TABLE = build_metrics_table()
+
 # Colors for lines (Sequential, Parallel, Hybrid)
 COLOR_SEQ = "#1f77b4"
 COLOR_PAR = "#ff7f0e"
 COLOR_HYB = "#2ca02c"
+SERIES = [("Sequential", COLOR_SEQ), ("Parallel", COLOR_PAR), ("Hybrid", COLOR_HYB)]
 
 # ============================================================
-# Helper: plot one metric vs THREADS (medium image)
-# X-axis: threads, Lines: Seq / Par / Hybrid
+# X-axis types: x values, x label, tick labels, title suffix
 # ============================================================
-def plot_metric_threads(metric_name, filename, y_label):
-    threads_list = [3, 6, 8, 12, 15]
-    x = np.array(threads_list, dtype=float)
-
-    seq_vals = []
-    par_vals = []
-    hyb_vals = []
-
-    for threads in threads_list:
-        seq_t = T_seq_medium
-        par_t = par_medium_by_threads[threads]
-        hyb_t = hyb_medium_by_threads[threads]
-
-        if metric_name == "time":
-            seq_vals.append(seq_t)
-            par_vals.append(par_t)
-            hyb_vals.append(hyb_t)
-
-        elif metric_name == "speedup":
-            S_seq = 1.0
-            S_par = T_seq_medium / par_t
-            S_hyb = T_seq_medium / hyb_t
-            seq_vals.append(S_seq)
-            par_vals.append(S_par)
-            hyb_vals.append(S_hyb)
-
-        elif metric_name == "efficiency":
-            p = threads
-            S_seq = 1.0
-            S_par = T_seq_medium / par_t
-            S_hyb = T_seq_medium / hyb_t
-            E_seq = S_seq / p
-            E_par = S_par / p
-            E_hyb = S_hyb / p
-            seq_vals.append(E_seq)
-            par_vals.append(E_par)
-            hyb_vals.append(E_hyb)
-
-        elif metric_name == "cost":
-            p = threads
-            C_seq = 1 * seq_t
-            C_par = p * par_t
-            C_hyb = p * hyb_t
-            seq_vals.append(C_seq)
-            par_vals.append(C_par)
-            hyb_vals.append(C_hyb)
-
-        elif metric_name == "throughput":
-            Th_seq = PIX_MED / (seq_t * 1e6)
-            Th_par = PIX_MED / (par_t * 1e6)
-            Th_hyb = PIX_MED / (hyb_t * 1e6)
-            seq_vals.append(Th_seq)
-            par_vals.append(Th_par)
-            hyb_vals.append(Th_hyb)
-
-        else:
-            raise ValueError("Unknown metric")
-
-    plt.figure(figsize=(7, 5))
-    plt.plot(x, seq_vals, marker="o", linewidth=2, color=COLOR_SEQ, label="Sequential")
-    plt.plot(x, par_vals, marker="o", linewidth=2, color=COLOR_PAR, label="Parallel")
-    plt.plot(x, hyb_vals, marker="o", linewidth=2, color=COLOR_HYB, label="Hybrid")
-
-    plt.xlabel("Number of Threads", fontsize=12)
-    plt.ylabel(y_label, fontsize=12)
-    plt.title(f"{metric_name.capitalize()} vs Number of Threads\n(Medium image)", fontsize=13)
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.xticks(threads_list, [str(t) for t in threads_list])
-    plt.legend(fontsize=10)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, filename))
-    plt.show()
+AXIS_INFO = {
+    # threads (medium image)
+    "threads": (threads_medium, "Number of Threads",
+                [str(t) for t in threads_medium],
+                "Number of Threads\n(Medium image)"),
+    # processors (fine image)
+    "processors": (procs_fine, "Number of Processors",
+                   [str(p) for p in procs_fine],
+                   "Number of Processors\n(Fine image)"),
+    # granularity (small/medium/fine, 8 threads)
+    "granularity": (np.arange(len(granularity_data_time)), "Granularity (Image Size)",
+                    list(granularity_data_time.keys()),
+                    "Granularity\n(8 threads)"),
+}
 
+METRIC_LABELS = [
+    ("time", "Execution Time (s)"),
+    ("speedup", "Speedup (T_seq / T)"),
+    ("efficiency", "Efficiency (Speedup / p)"),
+    ("cost", "Cost (p × Time)"),
+    ("throughput", "Throughput (Mpixels / s)"),
+]
 
 # ============================================================
-# Helper: plot one metric vs PROCESSORS (fine image)
-# X-axis: processors, Lines: Seq / Par / Hybrid
+# Figure, Axes and Seq / Par / Hybrid lines per x-axis type.
+# Built on first use; later metrics only swap the y-data.
 # ============================================================
-def plot_metric_processors(metric_name, filename, y_label):
-    procs_list = [2, 5, 9]
-    x = np.array(procs_list, dtype=float)
-
-    seq_vals = []
-    par_vals = []
-    hyb_vals = []
-
-    for procs in procs_list:
-        seq_t = T_seq_fine
-        par_t = par_fine_by_procs[procs]
-        hyb_t = hyb_fine_by_procs[procs]
-
-        if metric_name == "time":
-            seq_vals.append(seq_t)
-            par_vals.append(par_t)
-            hyb_vals.append(hyb_t)
-
-        elif metric_name == "speedup":
-            S_seq = 1.0
-            S_par = T_seq_fine / par_t
-            S_hyb = T_seq_fine / hyb_t
-            seq_vals.append(S_seq)
-            par_vals.append(S_par)
-            hyb_vals.append(S_hyb)
-
-        elif metric_name == "efficiency":
-            p = procs
-            S_seq = 1.0
-            S_par = T_seq_fine / par_t
-            S_hyb = T_seq_fine / hyb_t
-            E_seq = S_seq / p
-            E_par = S_par / p
-            E_hyb = S_hyb / p
-            seq_vals.append(E_seq)
-            par_vals.append(E_par)
-            hyb_vals.append(E_hyb)
-
-        elif metric_name == "cost":
-            p = procs
-            C_seq = 1 * seq_t
-            C_par = p * par_t
-            C_hyb = p * hyb_t
-            seq_vals.append(C_seq)
-            par_vals.append(C_par)
-            hyb_vals.append(C_hyb)
-
-        elif metric_name == "throughput":
-            Th_seq = PIX_FINE / (seq_t * 1e6)
-            Th_par = PIX_FINE / (par_t * 1e6)
-            Th_hyb = PIX_FINE / (hyb_t * 1e6)
-            seq_vals.append(Th_seq)
-            par_vals.append(Th_par)
-            hyb_vals.append(Th_hyb)
-
-        else:
-            raise ValueError("Unknown metric")
-
-    plt.figure(figsize=(7, 5))
-    plt.plot(x, seq_vals, marker="o", linewidth=2, color=COLOR_SEQ, label="Sequential")
-    plt.plot(x, par_vals, marker="o", linewidth=2, color=COLOR_PAR, label="Parallel")
-    plt.plot(x, hyb_vals, marker="o", linewidth=2, color=COLOR_HYB, label="Hybrid")
-
-    plt.xlabel("Number of Processors", fontsize=12)
-    plt.ylabel(y_label, fontsize=12)
-    plt.title(f"{metric_name.capitalize()} vs Number of Processors\n(Fine image)", fontsize=13)
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.xticks(procs_list, [str(p) for p in procs_list])
-    plt.legend(fontsize=10)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, filename))
-    plt.show()
+_plot_cache = {}
+
+# Rendered plots as (path, bytes), written to disk in one go at the end
+_rendered = []
+
+def get_plot(axis_name):
+    if axis_name not in _plot_cache:
+        x, x_label, x_ticklabels, _ = AXIS_INFO[axis_name]
+        fig, ax = plt.subplots(figsize=(7, 5))
+        empty = np.zeros(len(x))
+        lines = tuple(
+            ax.plot(x, empty, marker="o", linewidth=2, color=color, label=label)[0]
+            for label, color in SERIES
+        )
+
+        ax.set_xlabel(x_label, fontsize=12)
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.set_xticks(x, x_ticklabels)
+        ax.legend(fontsize=10)
+        _plot_cache[axis_name] = (fig, ax, lines)
+    return _plot_cache[axis_name]
+
+
+def update_plot(axis_name, metric_name, path, y_label, fmt="svg"):
+    if (axis_name, metric_name) not in TABLE:
+        raise ValueError("Unknown metric")
+    fig, ax, lines = _plot_cache[axis_name]
+
+    for line, vals in zip(lines, TABLE[(axis_name, metric_name)]):
+        line.set_ydata(vals)
+    ax.relim()
+    ax.autoscale_view()
+
+    ax.set_ylabel(y_label, fontsize=12)
+    ax.set_title(f"{metric_name.capitalize()} vs {AXIS_INFO[axis_name][3]}", fontsize=13)
+    fig.tight_layout()
+    buf = BytesIO()
+    fig.savefig(buf, format=fmt)
+    return path, buf.getvalue()
+
+
+def write_rendered():
+    for path, data in _rendered:
+        with open(path, "wb") as f:
+            f.write(data)
+    _rendered.clear()
 
 
 # ============================================================
-# Helper: plot one metric vs GRANULARITY (small/medium/fine, 8 threads)
-# X-axis: granularity, Lines: Seq / Par / Hybrid
+# One job per (axis, metric); each job renders one file.
+# Top-level so it can run in a worker process.
 # ============================================================
-def plot_metric_granularity(metric_name, filename, y_label):
-    gran_labels = list(granularity_data_time.keys())  # ["Small","Medium","Fine"]
-    x = np.arange(len(gran_labels))
-
-    seq_vals = []
-    par_vals = []
-    hyb_vals = []
-
-    for label in gran_labels:
-        seq_t, par_t, hyb_t, pix = granularity_data_time[label]
-
-        if metric_name == "time":
-            seq_vals.append(seq_t)
-            par_vals.append(par_t)
-            hyb_vals.append(hyb_t)
-
-        elif metric_name == "speedup":
-            S_seq = 1.0
-            S_par = seq_t / par_t
-            S_hyb = seq_t / hyb_t
-            seq_vals.append(S_seq)
-            par_vals.append(S_par)
-            hyb_vals.append(S_hyb)
-
-        elif metric_name == "efficiency":
-            p = 8  # fixed threads
-            S_seq = 1.0
-            S_par = seq_t / par_t
-            S_hyb = seq_t / hyb_t
-            E_seq = S_seq / p
-            E_par = S_par / p
-            E_hyb = S_hyb / p
-            seq_vals.append(E_seq)
-            par_vals.append(E_par)
-            hyb_vals.append(E_hyb)
-
-        elif metric_name == "cost":
-            p = 8
-            C_seq = 1 * seq_t
-            C_par = p * par_t
-            C_hyb = p * hyb_t
-            seq_vals.append(C_seq)
-            par_vals.append(C_par)
-            hyb_vals.append(C_hyb)
-
-        elif metric_name == "throughput":
-            Th_seq = pix / (seq_t * 1e6)
-            Th_par = pix / (par_t * 1e6)
-            Th_hyb = pix / (hyb_t * 1e6)
-            seq_vals.append(Th_seq)
-            par_vals.append(Th_par)
-            hyb_vals.append(Th_hyb)
-
-        else:
-            raise ValueError("Unknown metric")
-
-    plt.figure(figsize=(7, 5))
-    plt.plot(x, seq_vals, marker="o", linewidth=2, color=COLOR_SEQ, label="Sequential")
-    plt.plot(x, par_vals, marker="o", linewidth=2, color=COLOR_PAR, label="Parallel")
-    plt.plot(x, hyb_vals, marker="o", linewidth=2, color=COLOR_HYB, label="Hybrid")
-
-    plt.xlabel("Granularity (Image Size)", fontsize=12)
-    plt.ylabel(y_label, fontsize=12)
-    plt.title(f"{metric_name.capitalize()} vs Granularity\n(8 threads)", fontsize=13)
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.xticks(x, gran_labels)
-    plt.legend(fontsize=10)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, filename))
-    plt.show()
+def render_plot(axis_name, metric_name, path, y_label, fmt="svg"):
+    get_plot(axis_name)
+    return update_plot(axis_name, metric_name, path, y_label, fmt)
+
+
+def generate_separate_plots(fmt="svg"):
+    # Output paths are joined once here, e.g.
+    # ("threads", "time", "output images/1_time_threads.svg", "Execution Time (s)", "svg")
+    jobs = [
+        (axis_name, metric_name,
+         os.path.join(OUTPUT_DIR, f"{i}_{metric_name}_{axis_name}.{fmt}"), y_label, fmt)
+        for i, (metric_name, y_label) in enumerate(METRIC_LABELS, start=1)
+        for axis_name in AXIS_INFO
+    ]
+
+    # Agg rendering is CPU-bound and holds the GIL, so use processes.
+    # More workers than jobs (or cores) only adds start-up cost.
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        _rendered.extend(pool.map(render_plot, *zip(*jobs)))
+    write_rendered()
+
+
+# ============================================================
+# All 15 plots in one 3 x 5 figure
+# Rows: x-axis type, Columns: metric
+# ============================================================
+def generate_combined_grid(fmt="svg"):
+    fig, axes = plt.subplots(len(AXIS_INFO), len(METRIC_LABELS), figsize=(30, 15))
+
+    for row, (axis_name, (x, x_label, x_ticklabels, title)) in enumerate(AXIS_INFO.items()):
+        for col, (metric_name, y_label) in enumerate(METRIC_LABELS):
+            ax = axes[row, col]
+            for vals, (label, color) in zip(TABLE[(axis_name, metric_name)], SERIES):
+                ax.plot(x, vals, marker="o", linewidth=2, color=color, label=label)
+
+            ax.set_xlabel(x_label, fontsize=12)
+            ax.set_ylabel(y_label, fontsize=12)
+            ax.set_title(f"{metric_name.capitalize()} vs {title}", fontsize=13)
+            ax.grid(True, linestyle="--", alpha=0.6)
+            ax.set_xticks(x, x_ticklabels)
+            ax.legend(fontsize=10)
+
+    fig.tight_layout()
+    fig.savefig(GRID_PATHS[fmt], format=fmt)
+    plt.close(fig)
 
 
 # ============================================================
 # MAIN: generate all 15 graphs
 # ============================================================
 if __name__ == "__main__":
-    # 1) Execution Time
-    plot_metric_threads("time", "1_time_threads.png", "Execution Time (s)")
-    plot_metric_processors("time", "1_time_processors.png", "Execution Time (s)")
-    plot_metric_granularity("time", "1_time_granularity.png", "Execution Time (s)")
-
-    # 2) Speedup
-    plot_metric_threads("speedup", "2_speedup_threads.png", "Speedup (T_seq / T)")
-    plot_metric_processors("speedup", "2_speedup_processors.png", "Speedup (T_seq / T)")
-    plot_metric_granularity("speedup", "2_speedup_granularity.png", "Speedup (T_seq / T)")
-
-    # 3) Efficiency
-    plot_metric_threads("efficiency", "3_efficiency_threads.png", "Efficiency (Speedup / p)")
-    plot_metric_processors("efficiency", "3_efficiency_processors.png", "Efficiency (Speedup / p)")
-    plot_metric_granularity("efficiency", "3_efficiency_granularity.png", "Efficiency (Speedup / p)")
-
-    # 4) Cost
-    plot_metric_threads("cost", "4_cost_threads.png", "Cost (p × Time)")
-    plot_metric_processors("cost", "4_cost_processors.png", "Cost (p × Time)")
-    plot_metric_granularity("cost", "4_cost_granularity.png", "Cost (p × Time)")
-
-    # 5) Throughput
-    plot_metric_threads("throughput", "5_throughput_threads.png", "Throughput (Mpixels / s)")
-    plot_metric_processors("throughput", "5_throughput_processors.png", "Throughput (Mpixels / s)")
-    plot_metric_granularity("throughput", "5_throughput_granularity.png", "Throughput (Mpixels / s)")
-
-    print("All 15 metric plots generated in folder:", OUTPUT_DIR)
+    parser = argparse.ArgumentParser(description="Plot HPC performance metrics.")
+    parser.add_argument("--separate", action="store_true",
+                        help="write the 15 plots as individual files instead of one grid")
+    parser.add_argument("--format", choices=PLOT_FORMATS, default="svg",
+                        help="output format (default: svg; png for viewers without SVG)")
+    args = parser.parse_args()
+
+    if args.separate:
+        generate_separate_plots(args.format)
+        print("All 15 metric plots generated in folder:", OUTPUT_DIR)
+    else:
+        generate_combined_grid(args.format)
+        print("All 15 metric plots generated in:", GRID_PATHS[args.format])
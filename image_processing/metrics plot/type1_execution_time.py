@@ -1,7 +1,45 @@
+import argparse
+import os
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.style.use("seaborn-v0_8")
+# The parts of the "seaborn-v0_8" style this figure actually uses
+# (grey axes background, white grid, no spines / ticks / legend frame)
+plt.rcParams.update({
+    "axes.facecolor": "#EAEAF2",
+    "axes.edgecolor": "white",
+    "axes.linewidth": 0.0,
+    "axes.axisbelow": True,
+    "axes.labelcolor": ".15",
+    "text.color": ".15",
+    "font.sans-serif": ["Arial", "Liberation Sans", "DejaVu Sans",
+                        "Bitstream Vera Sans", "sans-serif"],
+    "grid.color": "white",
+    "grid.linewidth": 1.0,
+    "xtick.color": ".15",
+    "ytick.color": ".15",
+    "xtick.major.size": 0.0,
+    "ytick.major.size": 0.0,
+    "xtick.major.pad": 7.0,
+    "ytick.major.pad": 7.0,
+    "ytick.labelsize": 10.0,
+    "legend.frameon": False,
+    "lines.markersize": 7.0,
+    "lines.markeredgewidth": 0.0,
+    "lines.solid_capstyle": "round",
+})
+
+plt.rcParams.update({"figure.dpi": 72, "savefig.dpi": 72, "svg.fonttype": "none"})
+
+parser = argparse.ArgumentParser(description="Plot execution time vs method.")
+parser.add_argument("--format", choices=("svg", "png"), default="svg",
+                    help="output format (default: svg; png for viewers without SVG)")
+args = parser.parse_args()
+
+OUTPUT_DIR = "output images"
+os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ------------------------------------------------------------
 # Raw Data
@@ -16,12 +54,14 @@ T_seq_medium = 3.3020
 T_seq_fine   = 12.1860
 
 # ---------- 1) Medium image: varying threads ----------
-par_medium_by_threads = {3: 2.0530, 6: 1.9570, 8: 1.9360, 12: 1.9330, 15: 1.9260}
-hyb_medium_by_threads = {3: 1.2751, 6: 1.2445, 8: 1.3129, 12: 1.2633, 15: 1.3226}
+threads_medium = np.array([3, 6, 8, 12, 15])
+par_medium = np.array([2.0530, 1.9570, 1.9360, 1.9330, 1.9260])
+hyb_medium = np.array([1.2751, 1.2445, 1.3129, 1.2633, 1.3226])
 
 # ---------- 2) Fine image: processors = threads ----------
-par_fine_by_procs = {2: 8.7610, 5: 6.9300, 9: 6.8020}
-hyb_fine_by_procs = {2: 4.2071, 5: 5.4811, 9: 4.4037}
+procs_fine = np.array([2, 5, 9])
+par_fine = np.array([8.7610, 6.9300, 6.8020])
+hyb_fine = np.array([4.2071, 5.4811, 4.4037])
 
 # ---------- 3) Granularity (small / medium / fine) ----------
 T_par_small_8  = 0.3600
@@ -38,6 +78,15 @@ granularity_data = {
     "Fine":   (T_seq_fine,   T_par_fine_8,   T_hyb_fine_8),
 }
 
+# ------------------------------------------------------------
+# One row of [seq, par, hyb] times per plotted line
+# ------------------------------------------------------------
+times_threads = np.column_stack([np.full(len(threads_medium), T_seq_medium),
+                                 par_medium, hyb_medium])
+times_procs = np.column_stack([np.full(len(procs_fine), T_seq_fine),
+                               par_fine, hyb_fine])
+times_gran = np.array(list(granularity_data.values()))
+
 # ------------------------------------------------------------
 # Plot Figure with 3 Neat Subplots
 # ------------------------------------------------------------
@@ -45,53 +94,46 @@ granularity_data = {
 fig, axs = plt.subplots(1, 3, figsize=(20, 6))
 colors = ["#0077b6", "#ef476f", "#06d6a0", "#ffd166", "#8a2be2"]
 
+
+# Shared decoration for all three subplots
+def _decorate(ax, title):
+    ax.set_title(title, fontsize=14)
+    ax.set_xticks(x)
+    ax.set_xticklabels(methods, fontsize=12, rotation=15)
+    ax.set_ylabel("Execution Time (seconds)", fontsize=12)
+    ax.grid(True, linestyle="--", alpha=0.6)
+    ax.legend(fontsize=10)
+
+
 # ==================================================
 # 1) Execution Time vs Method (Threads)
 # ==================================================
-for idx, threads in enumerate([3, 6, 8, 12, 15]):
-    seq = T_seq_medium
-    par = par_medium_by_threads[threads]
-    hyb = hyb_medium_by_threads[threads]
-    axs[0].plot(x, [seq, par, hyb], marker="o", linewidth=2,
-                color=colors[idx], label=f"{threads} Threads")
-
-axs[0].set_title("Execution Time vs Method\n(Varying Threads, Medium Image)", fontsize=14)
-axs[0].set_xticks(x)
-axs[0].set_xticklabels(methods, fontsize=12, rotation=15)
-axs[0].set_ylabel("Execution Time (seconds)", fontsize=12)
-axs[0].grid(True, linestyle="--", alpha=0.6)
-axs[0].legend(fontsize=10)
+for idx in range(len(threads_medium)):
+    axs[0].plot(x, times_threads[idx], marker="o", linewidth=2,
+                color=colors[idx], label=f"{threads_medium[idx]} Threads")
+
+_decorate(axs[0], "Execution Time vs Method\n(Varying Threads, Medium Image)")
 
 # ==================================================
 # 2) Execution Time vs Method (Processors)
 # ==================================================
-for idx, procs in enumerate([2, 5, 9]):
-    seq = T_seq_fine
-    par = par_fine_by_procs[procs]
-    hyb = hyb_fine_by_procs[procs]
-    axs[1].plot(x, [seq, par, hyb], marker="o", linewidth=2,
-                color=colors[idx], label=f"{procs} Processors")
-
-axs[1].set_title("Execution Time vs Method\n(Varying Processors, Fine Image)", fontsize=14)
-axs[1].set_xticks(x)
-axs[1].set_xticklabels(methods, fontsize=12, rotation=15)
-axs[1].set_ylabel("Execution Time (seconds)", fontsize=12)
-axs[1].grid(True, linestyle="--", alpha=0.6)
-axs[1].legend(fontsize=10)
+for idx in range(len(procs_fine)):
+    axs[1].plot(x, times_procs[idx], marker="o", linewidth=2,
+                color=colors[idx], label=f"{procs_fine[idx]} Processors")
+
+_decorate(axs[1], "Execution Time vs Method\n(Varying Processors, Fine Image)")
 
 # ==================================================
 # 3) Execution Time vs Method (Granularity)
 # ==================================================
-for idx, (gran, values) in enumerate(granularity_data.items()):
-    axs[2].plot(x, values, marker="o", linewidth=2,
+for idx, gran in enumerate(granularity_data):
+    axs[2].plot(x, times_gran[idx], marker="o", linewidth=2,
                 color=colors[idx], label=f"{gran} Image")
 
-axs[2].set_title("Execution Time vs Method\n(Varying Granularity, 8 Threads)", fontsize=14)
-axs[2].set_xticks(x)
-axs[2].set_xticklabels(methods, fontsize=12, rotation=15)
-axs[2].set_ylabel("Execution Time (seconds)", fontsize=12)
-axs[2].grid(True, linestyle="--", alpha=0.6)
-axs[2].legend(fontsize=10)
+_decorate(axs[2], "Execution Time vs Method\n(Varying Granularity, 8 Threads)")
 
 plt.tight_layout()
-plt.show()
+fig.savefig(os.path.join(OUTPUT_DIR, f"type1_execution_time.{args.format}"), format=args.format)
+plt.close(fig)
+
+print("Execution time plot saved in folder:", OUTPUT_DIR)